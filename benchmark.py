@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Times the contribution reports with different worker counts.
+
+Builds a throwaway database of random contributions and runs
+contribution_totals() over all history and over a date range, once per
+worker count. Exits with an error unless every run matches the
+single-process result exactly.
+
+    python3 benchmark.py --rows 2000000 --workers 1 2 4 8
+"""
+import sys
+import os
+import argparse
+import random
+import tempfile
+import time
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import create_engine
+from lib.models import Base, Contribution
+from lib.reports import contribution_totals
+
+
+def build_database(path, rows, contributors):
+    """Creates a database at path filled with random contributions."""
+    db_engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(db_engine)
+    start = date(2015, 1, 1)
+    rng = random.Random(0)
+    with db_engine.begin() as connection:
+        for offset in range(0, rows, 100000):
+            connection.execute(Contribution.__table__.insert(), [
+                {
+                    "amount": round(rng.uniform(1, 500), 2),
+                    "date": start + timedelta(days=rng.randrange(3650)),
+                    "contributor_id": rng.randrange(1, contributors + 1)
+                }
+                for _ in range(min(100000, rows - offset))
+            ])
+    db_engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1000000)
+    parser.add_argument("--contributors", type=int, default=5000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "benchmark.db")
+        print(f"CPUs available: {os.cpu_count()} (worker counts above this are capped)")
+        print(f"Building {args.rows} contributions for {args.contributors} contributors...")
+        build_database(path, args.rows, args.contributors)
+
+        cases = [
+            ("all history", {}),
+            ("2018-2021", {"start_date": date(2018, 1, 1), "end_date": date(2021, 12, 31)})
+        ]
+        for label, dates in cases:
+            expected = None
+            baseline = None
+            for workers in args.workers:
+                started = time.perf_counter()
+                # min_parallel_rows=0 measures the pool even below the usual threshold
+                result = contribution_totals(workers=workers, db_path=path,
+                                             min_parallel_rows=0, **dates)
+                elapsed = time.perf_counter() - started
+                if expected is None:
+                    expected, baseline = result, elapsed
+                max_diff = max((abs(result.get(k, {}).get("cents", 0) - v["cents"])
+                                for k, v in expected.items()), default=0)
+                print(f"{label:>12}  workers={workers:<3} {elapsed:8.3f}s  "
+                      f"speedup={baseline / elapsed:5.2f}x  "
+                      f"max total diff={max_diff / 100:.2f}")
+                if result != expected:
+                    sys.exit(f"workers={workers} did not match the single-process result")
+
+if __name__ == "__main__":
+    main()
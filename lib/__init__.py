@@ -1,3 +1,3 @@
-from .models import Base, Organization, Contributor, Contribution, create_tables, get_session
+from .models import Base, Organization, Contributor, Contribution, ChangeLog, Pledge, create_tables, get_session
 
-__all__ = ['Base', 'Organization', 'Contributor', 'Contribution', 'create_tables', 'get_session']
+__all__ = ['Base', 'Organization', 'Contributor', 'Contribution', 'ChangeLog', 'Pledge', 'create_tables', 'get_session']
@@ -1,6 +1,12 @@
+import json
+import os
+import sys
 from .models.organization import Organization
 from .models.contributor import Contributor
 from .models.contribution import Contribution
+from .models.change_log import ChangeLog
+from .models.pledge import Pledge, CADENCES
+from .reports import contribution_totals, summarize
 from .helpers import (
     display_menu,
     get_int_input,
@@ -17,8 +23,10 @@ from .helpers import (
 class CLI:
     """A command-line interface for the contributions management system."""
 
-    def __init__(self):
+    def __init__(self, row_limit=None, workers=1):
         self.running = True
+        self.row_limit = row_limit  # maximum rows shown per table, None for all
+        self.workers = workers  # processes used to compute reports
 
     def run(self):
         """Starts the main application loop."""
@@ -28,6 +36,7 @@ class CLI:
                 "Manage Organizations",
                 "Manage Contributors",
                 "Manage Contributions",
+                "Manage Pledges",
                 "View Reports",
                 "Exit"
             ])
@@ -39,8 +48,10 @@ class CLI:
             elif choice == 3:
                 self.contribution_menu()
             elif choice == 4:
-                self.reports_menu()
+                self.pledge_menu()
             elif choice == 5:
+                self.reports_menu()
+            elif choice == 6:
                 self.running = False
                 print_success("Exiting application. Goodbye!")
 
@@ -81,11 +92,12 @@ class CLI:
     def list_organizations(self):
         """Lists all organizations in the database using a formatted table."""
         organizations = Organization.get_all()
-        table_data = [
+        table_data = (
             {"ID": org.id, "Name": org.name, "Contact": org.contact_info}
             for org in organizations
-        ]
-        print_table(table_data, headers="keys", title="All Organizations")
+        )
+        print_table(table_data, headers="keys", title="All Organizations",
+                    limit=self.row_limit)
 
     def delete_organization(self):
         """Handles the deletion of an organization."""
@@ -183,7 +195,7 @@ class CLI:
     def list_contributors(self):
         """Lists all contributors with their details using a formatted table."""
         contributors = Contributor.get_all()
-        table_data = [
+        table_data = (
             {
                 "ID": cont.id,
                 "Name": cont.full_name,
@@ -193,8 +205,9 @@ class CLI:
                 "Progress (%)": f"{cont.progress_percentage:.2f}"
             }
             for cont in contributors
-        ]
-        print_table(table_data, headers="keys", title="All Contributors")
+        )
+        print_table(table_data, headers="keys", title="All Contributors",
+                    limit=self.row_limit)
 
     def update_contributor_target(self):
         """Updates the target contribution amount for a contributor."""
@@ -262,7 +275,7 @@ class CLI:
     def list_contributions(self):
         """Lists all contributions in the database using a formatted table."""
         contributions = Contribution.get_all()
-        table_data = [
+        table_data = (
             {
                 "ID": c.id,
                 "Amount ($)": f"{c.amount:.2f}",
@@ -270,8 +283,9 @@ class CLI:
                 "Contributor ID": c.contributor_id
             }
             for c in contributions
-        ]
-        print_table(table_data, headers="keys", title="All Contributions")
+        )
+        print_table(table_data, headers="keys", title="All Contributions",
+                    limit=self.row_limit)
 
     def find_contributions_by_contributor(self):
         """Finds and lists contributions for a specific contributor."""
@@ -279,10 +293,18 @@ class CLI:
         cont_id = get_int_input("Enter contributor ID: ")
         contributions = Contribution.find_by_contributor(cont_id)
         if contributions:
-            print_success(f"--- Contributions for Contributor {cont_id} ---")
-            for c in contributions:
-                print(
-                    f"ID: {c.id}, Amount: ${c.amount:.2f}, Date: {c.date}, Notes: {c.notes}")
+            table_data = (
+                {
+                    "ID": c.id,
+                    "Amount ($)": f"{c.amount:.2f}",
+                    "Date": c.date,
+                    "Notes": c.notes
+                }
+                for c in contributions
+            )
+            print_table(table_data, headers="keys",
+                        title=f"Contributions for Contributor {cont_id}",
+                        limit=self.row_limit)
         else:
             print_warning("No contributions found for this contributor.")
 
@@ -295,10 +317,18 @@ class CLI:
 
         contributions = Contribution.find_by_date_range(start_date, end_date)
         if contributions:
-            print(f"--- Contributions from {start_date} to {end_date} ---")
-            for c in contributions:
-                print(
-                    f"ID: {c.id}, Amount: ${c.amount:.2f}, Date: {c.date}, Contributor ID: {c.contributor_id}")
+            table_data = (
+                {
+                    "ID": c.id,
+                    "Amount ($)": f"{c.amount:.2f}",
+                    "Date": c.date,
+                    "Contributor ID": c.contributor_id
+                }
+                for c in contributions
+            )
+            print_table(table_data, headers="keys",
+                        title=f"Contributions from {start_date} to {end_date}",
+                        limit=self.row_limit)
         else:
             print_warning("No contributions found in this date range.")
 
@@ -312,6 +342,92 @@ class CLI:
         else:
             print_error("Contribution not found.")
 
+    # --- Pledge Management ---
+    def pledge_menu(self):
+        """Manages the pledge-related menu and actions."""
+        while True:
+            clear_screen()
+            choice = display_menu("Pledge Menu", [
+                "Add New Pledge",
+                "View All Pledges",
+                "Record Due Pledge Installments",
+                "Delete Pledge",
+                "Back to Main Menu"
+            ])
+
+            if choice == 1:
+                self.add_pledge()
+            elif choice == 2:
+                self.list_pledges()
+            elif choice == 3:
+                print("Record installments due up to which date?")
+                self.materialize_pledges(get_date_input())
+            elif choice == 4:
+                self.delete_pledge()
+            elif choice == 5:
+                break
+            input("\nPress Enter to continue...")
+
+    def add_pledge(self):
+        """Handles the addition of a new recurring pledge."""
+        self.list_contributors()
+        cont_id = get_int_input("Enter contributor ID: ")
+        amount = get_float_input("Enter installment amount: ", min_val=0.01)
+        choice = display_menu("Select Pledge Cadence", CADENCES)
+        cadence = CADENCES[choice - 1]
+        print("Enter start date.")
+        start_date = get_date_input()
+        end_date = None
+        if input("Does the pledge have an end date? (y/n): ").strip().lower() == "y":
+            print("Enter end date.")
+            end_date = get_date_input()
+        notes = input("Enter notes (optional): ")
+
+        try:
+            pledge = Pledge.create(amount, cont_id, cadence,
+                                   start_date, end_date, notes or None)
+            print_success(
+                f"Pledge of ${pledge.amount:.2f} {pledge.cadence} created with ID {pledge.id}.")
+        except ValueError as e:
+            print_error(f"Error creating pledge: {e}")
+
+    def list_pledges(self):
+        """Lists all pledges in the database using a formatted table."""
+        pledges = Pledge.get_all()
+        table_data = (
+            {
+                "ID": p.id,
+                "Contributor ID": p.contributor_id,
+                "Amount ($)": f"{p.amount:.2f}",
+                "Cadence": p.cadence,
+                "Start": p.start_date,
+                "End": p.end_date,
+                "Next Due": p.next_due_date
+            }
+            for p in pledges
+        )
+        print_table(table_data, headers="keys", title="All Pledges",
+                    limit=self.row_limit)
+
+    def materialize_pledges(self, as_of):
+        """Records all pledge installments due up to a date."""
+        contributions = Pledge.materialize_due(as_of)
+        if contributions:
+            total = sum(c.amount for c in contributions)
+            print_success(
+                f"Recorded {len(contributions)} pledge installments totalling ${total:.2f}.")
+        else:
+            print_warning(f"No pledge installments due up to {as_of}.")
+
+    def delete_pledge(self):
+        """Handles the deletion of a pledge."""
+        self.list_pledges()
+        pledge_id = get_int_input("Enter ID of pledge to delete: ")
+        if Pledge.delete(pledge_id):
+            print_success(f"Pledge with ID {pledge_id} deleted successfully.")
+        else:
+            print_error("Pledge not found.")
+
     # --- Reports Menu ---
     def reports_menu(self):
         """Displays a menu for viewing various reports."""
@@ -319,26 +435,112 @@ class CLI:
             clear_screen()
             choice = display_menu("Reports Menu", [
                 "Contributor Progress Report",
+                "Contributor Progress Report with Projected Pledges",
+                "Contribution Totals by Date Range",
+                "Change Log (Changes Since Sequence)",
                 "Back to Main Menu"
             ])
             if choice == 1:
                 self.show_contributor_progress_report()
             elif choice == 2:
+                print("Project pledge income up to which date?")
+                self.show_contributor_progress_report(projected_until=get_date_input())
+            elif choice == 3:
+                self.show_date_range_totals()
+            elif choice == 4:
+                self.show_changes_since()
+            elif choice == 5:
                 break
             input("\nPress Enter to continue...")
 
-    def show_contributor_progress_report(self):
-        """Generates and displays a report on contributor progress towards their target."""
+    def show_contributor_progress_report(self, projected_until=None):
+        """
+        Generates and displays a report on contributor progress towards their target.
+        If projected_until is given, pledge installments not yet recorded up to
+        that date are added as projected income.
+        """
         contributors = Contributor.get_all()
-        table_data = [
+        totals = contribution_totals(workers=self.workers)
+        projected = Pledge.projected_income(projected_until) if projected_until else None
+
+        def rows():
+            for cont in contributors:
+                total = totals.get(cont.id, {}).get("total", 0)
+                progress = total / cont.target_amount * 100 if cont.target_amount else 0
+                row = {
+                    "Name": cont.full_name,
+                    "Total Contrib. ($)": f"{total:.2f}",
+                    "Target ($)": f"{cont.target_amount:.2f}",
+                    "Progress (%)": f"{progress:.2f}"
+                }
+                if projected is not None:
+                    pledged = projected.get(cont.id, 0)
+                    expected = total + pledged
+                    row["Projected Pledges ($)"] = f"{pledged:.2f}"
+                    row["Projected Progress (%)"] = (
+                        f"{expected / cont.target_amount * 100:.2f}"
+                        if cont.target_amount else "0.00")
+                yield row
+
+        title = "Contributor Progress Report"
+        if projected_until:
+            title += f" (Pledges Projected to {projected_until})"
+        print_table(rows(), headers="keys", title=title, limit=self.row_limit)
+
+    def show_date_range_totals(self):
+        """Displays contribution totals per contributor within a date range."""
+        print("Enter start date.")
+        start_date = get_date_input()
+        print("Enter end date.")
+        end_date = get_date_input()
+
+        totals = contribution_totals(start_date, end_date, workers=self.workers)
+        table_data = (
             {
-                "Name": cont.full_name,
-                "Total Contrib. ($)": f"{cont.total_contributions:.2f}",
-                "Target ($)": f"{cont.target_amount:.2f}",
-                "Progress (%)": f"{cont.progress_percentage:.2f}"
+                "Contributor ID": cont_id,
+                "Contributions": t["count"],
+                "Total ($)": f"{t['total']:.2f}",
+                "First Date": t["first_date"],
+                "Last Date": t["last_date"]
             }
-            for cont in contributors
-        ]
+            for cont_id, t in sorted(totals.items(), key=lambda item: item[0] or 0)
+        )
+        print_table(table_data, headers="keys",
+                    title=f"Contribution Totals from {start_date} to {end_date}",
+                    limit=self.row_limit)
+        summary = summarize(totals)
+        if summary["count"]:
+            print(f"{summary['count']} contributions from {summary['contributors']} "
+                  f"contributors totalling ${summary['total']:.2f}")
+
+    def show_changes_since(self):
+        """Lists change log entries after a given sequence number."""
+        print(f"Latest sequence number: {ChangeLog.latest_seq()}")
+        since = get_int_input("Show changes after sequence number: ", min_val=0)
+        changes = ChangeLog.iter_changes_since(since)
+        table_data = (
+            {
+                "Seq": change.seq,
+                "Table": change.table_name,
+                "Record ID": change.record_id,
+                "Operation": change.operation,
+                "Actor": change.actor,
+                "Changed At": change.changed_at,
+                "Data": change.data
+            }
+            for change in changes
+        )
         print_table(table_data, headers="keys",
-                    title="Contributor Progress Report")
+                    title=f"Changes Since Sequence {since}", limit=self.row_limit)
 
+    def export_changes(self, after, limit=None):
+        """Writes change log entries after a sequence number to stdout, one JSON object per line."""
+        try:
+            for change in ChangeLog.iter_changes_since(after, limit):
+                sys.stdout.write(json.dumps(change.to_dict(), default=str) + "\n")
+            sys.stdout.flush()
+        except BrokenPipeError:
+            # The consumer stopped reading (e.g. piped into head). Point stdout
+            # at devnull so the flush at interpreter exit does not fail again.
+            devnull = os.open(os.devnull, os.O_WRONLY)
+            os.dup2(devnull, sys.stdout.fileno())
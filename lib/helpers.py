@@ -1,6 +1,12 @@
 import os
+import sys
 from datetime import datetime
-from tabulate import tabulate 
+from itertools import chain, islice
+
+# Table rendering settings
+TABLE_SAMPLE_SIZE = 100  # rows inspected to size columns
+TABLE_MAX_COL_WIDTH = 40  # longer cells are truncated on a terminal
+TABLE_FLUSH_ROWS = 500  # rows buffered between writes
 
 def display_menu(title, options):
     """Displays a menu and gets a valid integer choice from the user."""
@@ -64,17 +70,129 @@ def print_warning(message):
     """Prints a message in yellow color."""
     print(f"\033[93m{message}\033[0m")
 
-def print_table(data, headers, title=None):
-    """Prints data in a formatted table."""
-    if title:
-        print(f"\n--- {title} ---")
-    if not data:
-        print_warning("No data found.")
+def _cell_text(value):
+    """Converts a table cell to a single line of text."""
+    if value is None:
+        return ""
+    return str(value).replace("\t", " ").replace("\n", " ")
+
+def _is_number(text):
+    """Returns True if the text parses as a number."""
+    try:
+        float(text)
+        return True
+    except ValueError:
+        return False
+
+def _fit(text, width, right=False):
+    """Truncates or pads text to exactly the given width."""
+    if len(text) > width:
+        return text[:width - 1] + "…" if width > 1 else text[:width]
+    return text.rjust(width) if right else text.ljust(width)
+
+def print_table(data, headers, title=None, limit=None, widths=None, out=None):
+    """
+    Prints data in a formatted table, writing rows as they are produced.
+
+    data may be a list or any iterable (such as a generator) of dicts or
+    sequences; headers is "keys" for dicts or a list of column names.
+    Column widths come from the widths hint (a list, one per column) or
+    from the first TABLE_SAMPLE_SIZE rows, and longer cells are truncated.
+    At most limit rows are printed. When output is not a terminal, rows
+    are written as plain tab-separated text on stdout, with the title and
+    notices on stderr. Raises ValueError if widths or a sequence row does
+    not match the number of columns.
+    """
+    out = out or sys.stdout
+    tty = out.isatty()
+    # Plain output may be piped into other tools, so notices go to stderr
+    notice = out if tty else sys.stderr
+
+    rows = iter(data)
+    sample_size = TABLE_SAMPLE_SIZE if limit is None else min(limit, TABLE_SAMPLE_SIZE)
+    sample = list(islice(rows, sample_size))
+
+    if not sample:
+        if title:
+            notice.write(f"\n--- {title} ---\n")
+        out.flush()
+        if tty:
+            print_warning("No data found.")
+        else:
+            notice.write("No data found.\n")
         return
-    
-    # Ensure data is a list of dictionaries
-    if isinstance(data[0], dict):
-        print(tabulate(data, headers="keys", tablefmt="fancy_grid"))
+
+    # Work out the column names and how to pull values out of each row
+    if isinstance(sample[0], dict):
+        columns = list(sample[0].keys()) if headers == "keys" else list(headers)
+        values = lambda row: [_cell_text(row.get(col)) for col in columns]
     else:
-        # Fallback for other formats
-        print(tabulate(data, headers=headers, tablefmt="fancy_grid"))
\ No newline at end of file
+        columns = list(headers) if headers != "keys" else [str(i) for i in range(len(sample[0]))]
+
+        def values(row):
+            if len(row) != len(columns):
+                raise ValueError(
+                    f"Row has {len(row)} values but the table has {len(columns)} columns")
+            return [_cell_text(value) for value in row]
+
+    if widths is not None and len(widths) != len(columns):
+        raise ValueError(
+            f"Got {len(widths)} column widths for {len(columns)} columns")
+    # Convert the sampled rows up front, so a bad row is caught before any output
+    sample_cells = [values(row) for row in sample]
+    if title:
+        notice.write(f"\n--- {title} ---\n")
+
+    remaining = None if limit is None else limit - len(sample)
+    rest = rows if remaining is None else islice(rows, remaining)
+    body = chain(sample_cells, (values(row) for row in rest))
+
+    if tty:
+        if widths is None:
+            widths = [
+                min(TABLE_MAX_COL_WIDTH,
+                    max([len(col)] + [len(cells[i]) for cells in sample_cells]))
+                for i, col in enumerate(columns)
+            ]
+        # Right-align columns whose sampled values are all numeric
+        numeric = [
+            all(_is_number(cells[i]) for cells in sample_cells if cells[i])
+            for i in range(len(columns))
+        ]
+
+        def line(left, fill, mid, right):
+            return left + mid.join(fill * (w + 2) for w in widths) + right + "\n"
+
+        def row_line(cells, align=True):
+            return "\u2502 " + " \u2502 ".join(
+                _fit(cell, w, align and num)
+                for cell, w, num in zip(cells, widths, numeric)
+            ) + " \u2502\n"
+
+        out.write(line("\u2552", "\u2550", "\u2564", "\u2555"))
+        out.write(row_line(columns, align=False))
+        out.write(line("\u255e", "\u2550", "\u256a", "\u2561"))
+        footer = line("\u2558", "\u2550", "\u2567", "\u255b")
+        format_row = row_line
+    else:
+        out.write("\t".join(columns) + "\n")
+        footer = ""
+        format_row = lambda cells: "\t".join(cells) + "\n"
+
+    buffer = []
+    try:
+        for cells in body:
+            buffer.append(format_row(cells))
+            if len(buffer) >= TABLE_FLUSH_ROWS:
+                out.write("".join(buffer))
+                buffer = []
+    finally:
+        # Close the table even if a later row turns out to be malformed
+        buffer.append(footer)
+        out.write("".join(buffer))
+        out.flush()
+
+    # Peek one row past the limit to tell the user output was cut short
+    if limit is not None and next(rows, None) is not None:
+        notice.write(f"(showing first {limit} rows)\n")
+    notice.flush()
@@ -2,6 +2,8 @@ from .base import Base, engine, session, create_tables, get_session
 from .organization import Organization
 from .contributor import Contributor
 from .contribution import Contribution
+from .change_log import ChangeLog
+from .pledge import Pledge
 
 __all__ = ['Base', 'engine', 'session', 'create_tables', 'get_session', 
-           'Organization', 'Contributor', 'Contribution']
\ No newline at end of file
+           'Organization', 'Contributor', 'Contribution', 'ChangeLog', 'Pledge']
\ No newline at end of file
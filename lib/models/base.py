@@ -16,6 +16,8 @@ def create_tables():
     from .organization import Organization
     from .contributor import Contributor
     from .contribution import Contribution
+    from .change_log import ChangeLog
+    from .pledge import Pledge
     Base.metadata.create_all(engine)
 
 def get_session():
@@ -26,6 +28,8 @@ def get_session():
 from .organization import Organization
 from .contributor import Contributor
 from .contribution import Contribution
+from .change_log import ChangeLog
+from .pledge import Pledge
 
 __all__ = ['Base', 'engine', 'session', 'create_tables', 'get_session', 
-           'Organization', 'Contributor', 'Contribution']
\ No newline at end of file
+           'Organization', 'Contributor', 'Contribution', 'ChangeLog', 'Pledge']
\ No newline at end of file
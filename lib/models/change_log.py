@@ -0,0 +1,127 @@
+import getpass
+import json
+from sqlalchemy import Column, Integer, String, Text, DateTime
+from datetime import datetime, timezone
+from .base import Base, session
+
+
+def _current_actor():
+    """Returns the name of the user performing the write."""
+    try:
+        return getpass.getuser()
+    except Exception:
+        return None
+
+
+def _utc_now():
+    """Returns the current time in UTC, without tzinfo as SQLite stores it."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+class ChangeLog(Base):
+    """Represents an append-only record of a write made to another table."""
+    __tablename__ = 'change_log'
+    # AUTOINCREMENT keeps sequence numbers strictly increasing, never reused
+    __table_args__ = {'sqlite_autoincrement': True}
+
+    seq = Column(Integer, primary_key=True)
+    table_name = Column(String, nullable=False)
+    record_id = Column(Integer)  # None for batch records
+    operation = Column(String, nullable=False)  # create, update, delete or batch
+    actor = Column(String, default=_current_actor)
+    changed_at = Column(DateTime, default=_utc_now)  # UTC
+    data = Column(Text)
+
+    def __repr__(self):
+        return (f"<ChangeLog(seq={self.seq}, table='{self.table_name}', "
+                f"record_id={self.record_id}, operation='{self.operation}')>")
+
+    @property
+    def payload(self):
+        """Returns the decoded data stored with this change."""
+        return json.loads(self.data) if self.data else None
+
+    def to_dict(self):
+        """Returns this change as a JSON-serializable dict."""
+        return {
+            "seq": self.seq,
+            "table": self.table_name,
+            "record_id": self.record_id,
+            "operation": self.operation,
+            "actor": self.actor,
+            "changed_at": (self.changed_at.replace(tzinfo=timezone.utc).isoformat()
+                           if self.changed_at else None),
+            "data": self.payload
+        }
+
+    @staticmethod
+    def snapshot(obj):
+        """Returns a dict of the column values of a model instance."""
+        return {column.name: getattr(obj, column.name) for column in obj.__table__.columns}
+
+    # ORM methods
+    @classmethod
+    def record(cls, operation, obj, data=None):
+        """
+        Adds a change entry for a model instance to the current session.
+        The entry is not committed here, so it lands in the same transaction
+        as the write it describes.
+        """
+        if data is None:
+            data = cls.snapshot(obj)
+        entry = cls(
+            table_name=obj.__tablename__,
+            record_id=obj.id,
+            operation=operation,
+            data=json.dumps(data, default=str)
+        )
+        session.add(entry)
+        return entry
+
+    @classmethod
+    def record_batch(cls, operation, table_name, rows):
+        """
+        Adds a single compact entry describing a bulk operation on many rows.
+        Like record(), the caller is responsible for committing.
+        """
+        entry = cls(
+            table_name=table_name,
+            operation="batch",
+            data=json.dumps({"operation": operation, "rows": rows}, default=str)
+        )
+        session.add(entry)
+        return entry
+
+    @classmethod
+    def changes_since(cls, seq, limit=None):
+        """Returns changes with a sequence number greater than seq, oldest first."""
+        query = session.query(cls).filter(cls.seq > seq).order_by(cls.seq)
+        if limit is not None:
+            query = query.limit(limit)
+        return query.all()
+
+    @classmethod
+    def iter_changes_since(cls, seq, limit=None, page_size=1000):
+        """
+        Yields changes with a sequence number greater than seq, oldest first.
+        Rows are fetched in pages by sequence number and removed from the
+        session once yielded, so the whole log is never held in memory.
+        """
+        remaining = limit
+        while remaining is None or remaining > 0:
+            size = page_size if remaining is None else min(page_size, remaining)
+            page = session.query(cls).filter(cls.seq > seq).order_by(cls.seq).limit(size).all()
+            if not page:
+                return
+            for change in page:
+                yield change
+                session.expunge(change)
+            seq = page[-1].seq
+            if remaining is not None:
+                remaining -= len(page)
+
+    @classmethod
+    def latest_seq(cls):
+        """Returns the highest sequence number written so far, or 0."""
+        last = session.query(cls.seq).order_by(cls.seq.desc()).first()
+        return last[0] if last else 0
@@ -2,6 +2,7 @@ from sqlalchemy import Column, Integer, Float, String, Date, ForeignKey
 from sqlalchemy.orm import relationship, validates
 from datetime import datetime
 from .base import Base, session
+from .change_log import ChangeLog
 
 class Contribution(Base):
     """Represents a financial contribution."""
@@ -41,6 +42,8 @@ class Contribution(Base):
             date=date
         )
         session.add(contribution)
+        session.flush()
+        ChangeLog.record("create", contribution)
         session.commit()
         return contribution
     
@@ -72,6 +75,7 @@ class Contribution(Base):
         """Deletes a contribution by its ID."""
         contribution = cls.find_by_id(id)
         if contribution:
+            ChangeLog.record("delete", contribution)
             session.delete(contribution)
             session.commit()
             return True
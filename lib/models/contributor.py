@@ -2,6 +2,7 @@ from sqlalchemy import Column, Integer, String, ForeignKey, Float
 from sqlalchemy.orm import relationship, validates
 from .base import Base, session
 from .contribution import Contribution
+from .change_log import ChangeLog
 
 class Contributor(Base):
     """Represents a contributor (member, volunteer, or donor)."""
@@ -18,6 +19,7 @@ class Contributor(Base):
     # Relationships
     organization = relationship("Organization", back_populates="contributors")
     contributions = relationship("Contribution", back_populates="contributor", cascade="all, delete-orphan")
+    pledges = relationship("Pledge", back_populates="contributor", cascade="all, delete-orphan")
     
     def __repr__(self):
         return f"<Contributor(id={self.id}, name='{self.first_name} {self.last_name}', type='{self.type}')>"
@@ -79,6 +81,8 @@ class Contributor(Base):
             organization_id=organization_id
         )
         session.add(contributor)
+        session.flush()
+        ChangeLog.record("create", contributor)
         session.commit()
         return contributor
     
@@ -87,7 +91,11 @@ class Contributor(Base):
         """Updates the target contribution amount for a contributor."""
         contributor = cls.find_by_id(contributor_id)
         if contributor:
+            old_amount = contributor.target_amount
             contributor.target_amount = target_amount
+            ChangeLog.record("update", contributor, {
+                "target_amount": {"old": old_amount, "new": target_amount}
+            })
             session.commit()
             return True
         return False
@@ -120,6 +128,12 @@ class Contributor(Base):
         """Deletes a contributor by their ID."""
         contributor = cls.find_by_id(id)
         if contributor:
+            data = ChangeLog.snapshot(contributor)
+            data["cascade"] = {
+                "contributions": [c.id for c in contributor.contributions],
+                "pledges": [p.id for p in contributor.pledges]
+            }
+            ChangeLog.record("delete", contributor, data)
             session.delete(contributor)
             session.commit()
             return True
@@ -1,6 +1,7 @@
 from sqlalchemy import Column, Integer, String
 from sqlalchemy.orm import relationship
 from .base import Base, session
+from .change_log import ChangeLog
 
 class Organization(Base):
     """Represents an organization in the database."""
@@ -22,6 +23,8 @@ class Organization(Base):
         """Creates a new organization."""
         organization = cls(name=name, contact_info=contact_info)
         session.add(organization)
+        session.flush()
+        ChangeLog.record("create", organization)
         session.commit()
         return organization
     
@@ -40,6 +43,21 @@ class Organization(Base):
         """Deletes an organization by its ID."""
         organization = cls.find_by_id(id)
         if organization:
+            data = ChangeLog.snapshot(organization)
+            data["cascade"] = {
+                "contributors": [c.id for c in organization.contributors],
+                "contributions": [
+                    contribution.id
+                    for c in organization.contributors
+                    for contribution in c.contributions
+                ],
+                "pledges": [
+                    pledge.id
+                    for c in organization.contributors
+                    for pledge in c.pledges
+                ]
+            }
+            ChangeLog.record("delete", organization, data)
             session.delete(organization)
             session.commit()
             return True
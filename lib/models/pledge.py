@@ -0,0 +1,185 @@
+import calendar
+from sqlalchemy import Column, Integer, Float, String, Date, ForeignKey
+from sqlalchemy.orm import relationship, validates
+from datetime import timedelta
+from .base import Base, session
+from .contribution import Contribution
+from .change_log import ChangeLog
+
+CADENCES = ['weekly', 'monthly', 'quarterly', 'yearly']
+
+
+def _add_months(date, months, day):
+    """Returns date moved forward by whole months, clamping day to the month length."""
+    month_index = date.month - 1 + months
+    year = date.year + month_index // 12
+    month = month_index % 12 + 1
+    return date.replace(year=year, month=month, day=min(day, calendar.monthrange(year, month)[1]))
+
+
+class Pledge(Base):
+    """Represents a recurring contribution a contributor has committed to."""
+    __tablename__ = 'pledges'
+
+    id = Column(Integer, primary_key=True)
+    amount = Column(Float, nullable=False)
+    cadence = Column(String, nullable=False)  # weekly, monthly, quarterly or yearly
+    start_date = Column(Date, nullable=False)
+    end_date = Column(Date)  # None for open-ended pledges
+    # Date of the next installment to materialize, None once the pledge is finished.
+    # Indexed so the scheduler only reads pledges that are due.
+    next_due_date = Column(Date, index=True)
+    notes = Column(String)
+    contributor_id = Column(Integer, ForeignKey('contributors.id'))
+
+    # Relationship
+    contributor = relationship("Contributor", back_populates="pledges")
+
+    def __repr__(self):
+        return (f"<Pledge(id={self.id}, amount={self.amount}, cadence='{self.cadence}', "
+                f"next_due_date='{self.next_due_date}')>")
+
+    # Validation
+    @validates('amount')
+    def validate_amount(self, key, amount):
+        """Validates that the pledge amount is positive."""
+        if amount <= 0:
+            raise ValueError("Amount must be greater than 0")
+        return amount
+
+    @validates('cadence')
+    def validate_cadence(self, key, cadence):
+        """Validates that the cadence is one of the allowed values."""
+        if cadence not in CADENCES:
+            raise ValueError(f"Cadence must be one of: {', '.join(CADENCES)}")
+        return cadence
+
+    # Schedule helpers
+    def following_date(self, date):
+        """Returns the installment date that comes after the given one."""
+        if self.cadence == 'weekly':
+            return date + timedelta(weeks=1)
+        months = {'monthly': 1, 'quarterly': 3, 'yearly': 12}[self.cadence]
+        # Anchor on the start day so e.g. the 31st stays the last day of each month
+        return _add_months(date, months, self.start_date.day)
+
+    def is_active_on(self, date):
+        """Returns True if an installment on the given date falls within the pledge."""
+        return date is not None and (self.end_date is None or date <= self.end_date)
+
+    def due_dates(self, until):
+        """Yields the dates of unmaterialized installments up to and including until."""
+        date = self.next_due_date
+        while self.is_active_on(date) and date <= until:
+            yield date
+            date = self.following_date(date)
+
+    # ORM methods
+    @classmethod
+    def create(cls, amount, contributor_id, cadence, start_date, end_date=None, notes=None):
+        """Creates a new pledge."""
+        if end_date is not None and end_date < start_date:
+            raise ValueError("End date cannot be before start date")
+        pledge = cls(
+            amount=amount,
+            contributor_id=contributor_id,
+            cadence=cadence,
+            start_date=start_date,
+            end_date=end_date,
+            next_due_date=start_date,
+            notes=notes
+        )
+        session.add(pledge)
+        session.flush()
+        ChangeLog.record("create", pledge)
+        session.commit()
+        return pledge
+
+    @classmethod
+    def get_all(cls):
+        """Returns all pledges."""
+        return session.query(cls).all()
+
+    @classmethod
+    def find_by_id(cls, id):
+        """Finds a pledge by its ID."""
+        return session.query(cls).filter(cls.id == id).first()
+
+    @classmethod
+    def find_due(cls, as_of):
+        """Finds all pledges with an installment due on or before a date."""
+        return session.query(cls).filter(cls.next_due_date <= as_of).all()
+
+    @classmethod
+    def materialize_due(cls, as_of):
+        """
+        Records a contribution for every pledge installment due up to a date.
+        All installments are written in one transaction together with the
+        advanced due dates, so running this again for the same date adds
+        nothing. Each due date is advanced with a conditional update, so if
+        another run has already claimed a pledge it is skipped rather than
+        recorded twice. If anything fails, the whole run is rolled back.
+        Returns the list of contributions created.
+        """
+        contributions = []
+        advanced = []
+        try:
+            for pledge in cls.find_due(as_of):
+                dates = list(pledge.due_dates(as_of))
+                if not dates:
+                    continue
+                next_date = pledge.following_date(dates[-1])
+                new_due_date = next_date if pledge.is_active_on(next_date) else None
+                claimed = session.query(cls).filter(
+                    cls.id == pledge.id,
+                    cls.next_due_date == pledge.next_due_date
+                ).update({cls.next_due_date: new_due_date}, synchronize_session=False)
+                # Reload the due date from the database next time it is read
+                session.expire(pledge, ["next_due_date"])
+                if not claimed:
+                    continue
+                for date in dates:
+                    contributions.append(Contribution(
+                        amount=pledge.amount,
+                        contributor_id=pledge.contributor_id,
+                        date=date,
+                        notes=pledge.notes or f"Pledge {pledge.id} installment"
+                    ))
+                advanced.append({"id": pledge.id, "next_due_date": new_due_date})
+
+            if not advanced:
+                return contributions
+            session.add_all(contributions)
+            session.flush()
+            ChangeLog.record_batch("create", Contribution.__tablename__,
+                                   [ChangeLog.snapshot(c) for c in contributions])
+            ChangeLog.record_batch("update", cls.__tablename__, advanced)
+            session.commit()
+            return contributions
+        except Exception:
+            # Undo any claimed due dates so their installments are not lost
+            session.rollback()
+            raise
+
+    @classmethod
+    def projected_income(cls, until):
+        """
+        Returns a dict of contributor ID to the total of pledge installments
+        not yet recorded up to a date. No rows are written.
+        """
+        totals = {}
+        for pledge in session.query(cls).filter(cls.next_due_date <= until).all():
+            count = sum(1 for _ in pledge.due_dates(until))
+            totals[pledge.contributor_id] = totals.get(pledge.contributor_id, 0) + count * pledge.amount
+        return totals
+
+    @classmethod
+    def delete(cls, id):
+        """Deletes a pledge by its ID."""
+        pledge = cls.find_by_id(id)
+        if pledge:
+            ChangeLog.record("delete", pledge)
+            session.delete(pledge)
+            session.commit()
+            return True
+        return False
@@ -0,0 +1,162 @@
+import math
+import os
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from sqlalchemy import create_engine, func, select, cast, Integer
+from .models.base import engine
+from .models.contribution import Contribution
+
+# Below this many contributions a report stays in one process. Starting a
+# process pool costs more than it saves on small tables.
+PARALLEL_MIN_ROWS = 1000000
+
+# Engine opened once per worker process by _init_worker
+_worker_engine = None
+
+
+def _default_db_path():
+    """Returns the absolute path of the application's database file."""
+    return os.path.abspath(engine.url.database)
+
+
+def _read_only_engine(db_path):
+    """Creates an engine with its own read-only connection to the database."""
+    # as_uri() percent-encodes characters such as '#', '?' and '%' in the path
+    uri = Path(db_path).resolve().as_uri() + "?mode=ro"
+    return create_engine("sqlite://", creator=lambda: sqlite3.connect(uri, uri=True))
+
+
+def _init_worker(db_path):
+    """Opens the read-only engine reused by every partition a worker handles."""
+    global _worker_engine
+    _worker_engine = _read_only_engine(db_path)
+
+
+def _date_filters(table, start_date, end_date):
+    """Builds the same date conditions as Contribution.find_by_date_range."""
+    filters = []
+    if start_date is not None:
+        filters.append(table.c.date >= start_date)
+    if end_date is not None:
+        filters.append(table.c.date <= end_date)
+    return filters
+
+
+def _aggregate_partition(low_id, high_id, start_date=None, end_date=None, db_engine=None):
+    """
+    Aggregates contributions with low_id <= id < high_id per contributor.
+    Returns a dict of contributor ID to (count, total in cents, first date,
+    last date). Uses db_engine if given, otherwise the worker's own engine.
+    """
+    table = Contribution.__table__
+    query = (
+        select(
+            table.c.contributor_id,
+            func.count(table.c.id),
+            # Integer cents add up exactly, whatever order the rows are summed in
+            func.sum(cast(func.round(table.c.amount * 100), Integer)),
+            func.min(table.c.date),
+            func.max(table.c.date)
+        )
+        .where(table.c.id >= low_id, table.c.id < high_id,
+               *_date_filters(table, start_date, end_date))
+        .group_by(table.c.contributor_id)
+    )
+    with (db_engine or _worker_engine).connect() as connection:
+        return {row[0]: tuple(row[1:]) for row in connection.execute(query)}
+
+
+def _partitions(low, high, parts):
+    """Splits the ID range low..high into at most parts half-open ranges."""
+    if low is None:
+        return []
+    size = max(1, math.ceil((high - low + 1) / parts))
+    return [(start, min(start + size, high + 1)) for start in range(low, high + 1, size)]
+
+
+def _merge(partials):
+    """
+    Combines per-partition aggregates into one result per contributor.
+    Counts and cents are added and first/last dates compared, so the result
+    is the same however the rows were partitioned. Cents are converted to
+    dollars once, after merging.
+    """
+    merged = {}
+    for partial in partials:
+        for contributor_id, (count, cents, first, last) in partial.items():
+            if contributor_id not in merged:
+                merged[contributor_id] = [0, 0, first, last]
+            entry = merged[contributor_id]
+            entry[0] += count
+            entry[1] += cents
+            entry[2] = min(entry[2], first)
+            entry[3] = max(entry[3], last)
+    return {
+        contributor_id: {
+            "count": count,
+            "cents": cents,
+            "total": cents / 100,
+            "first_date": first,
+            "last_date": last
+        }
+        for contributor_id, (count, cents, first, last) in merged.items()
+    }
+
+
+def _id_span(db_engine):
+    """Returns the lowest and highest contribution ID, or (None, None) if there are none."""
+    table = Contribution.__table__
+    with db_engine.connect() as connection:
+        return connection.execute(
+            select(func.min(table.c.id), func.max(table.c.id))).one()
+
+
+def contribution_totals(start_date=None, end_date=None, workers=1, db_path=None,
+                        min_parallel_rows=PARALLEL_MIN_ROWS):
+    """
+    Returns a dict of contributor ID to a dict with the count, total (in
+    cents and dollars), first date and last date of their contributions,
+    optionally limited to a date range. With workers > 1 the contribution
+    ID range is split into one partition per worker across a process pool,
+    and each worker reads its slice over its own read-only connection.
+    Workers are capped at the CPU count, and the report stays in one
+    process while the ID range spans fewer than min_parallel_rows rows.
+    """
+    db_path = db_path or _default_db_path()
+    workers = max(1, min(workers, os.cpu_count() or 1))
+    db_engine = _read_only_engine(db_path)
+    try:
+        low, high = _id_span(db_engine)
+        if low is not None and high - low + 1 < min_parallel_rows:
+            workers = 1
+        ranges = _partitions(low, high, workers)
+        if len(ranges) <= 1:
+            partials = [_aggregate_partition(low, high, start_date, end_date, db_engine)
+                        for low, high in ranges]
+            return _merge(partials)
+    finally:
+        db_engine.dispose()
+
+    n = len(ranges)
+    with ProcessPoolExecutor(max_workers=n, initializer=_init_worker,
+                             initargs=(db_path,)) as executor:
+        partials = list(executor.map(
+            _aggregate_partition,
+            [low for low, _ in ranges],
+            [high for _, high in ranges],
+            [start_date] * n,
+            [end_date] * n
+        ))
+    return _merge(partials)
+
+
+def summarize(totals):
+    """Returns the overall count and total from a contribution_totals() result."""
+    cents = sum(t["cents"] for t in totals.values())
+    return {
+        "count": sum(t["count"] for t in totals.values()),
+        "cents": cents,
+        "total": cents / 100,
+        "contributors": len(totals)
+    }
@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 import sys
 import os
+import argparse
+from datetime import date, datetime
 
 # Add the current directory to Python path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -15,14 +17,51 @@ except ImportError as e:
         print(f"  {path}")
     raise
 
+def positive_int(value):
+    """Parses an argparse value that must be an integer of at least 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
+
+def parse_args():
+    """Parses command-line options."""
+    parser = argparse.ArgumentParser(description="Contribution tracker")
+    parser.add_argument("--limit", type=positive_int, default=None,
+                        help="maximum number of rows shown in each table")
+    parser.add_argument("--workers", type=positive_int, default=1,
+                        help="processes used to compute reports, capped at the CPU count (default: 1)")
+    commands = parser.add_subparsers(dest="command")
+    run_pledges = commands.add_parser(
+        "run-pledges", help="record all pledge installments due up to a date and exit")
+    run_pledges.add_argument(
+        "--until", type=lambda s: datetime.strptime(s, "%Y-%m-%d").date(),
+        default=date.today(), help="last due date to record, YYYY-MM-DD (default: today)")
+    changes_since = commands.add_parser(
+        "changes-since", help="print change log entries as JSON lines and exit")
+    changes_since.add_argument(
+        "--after", type=int, default=0, metavar="N",
+        help="print changes with a sequence number greater than N (default: 0)")
+    # Separate dest so it does not clash with the top-level table --limit
+    changes_since.add_argument(
+        "--limit", type=positive_int, default=None, dest="max_changes", metavar="M",
+        help="print at most M changes")
+    return parser.parse_args()
+
 def main():
     """
     Main function to initialize the application.
     It creates the database tables and starts the CLI.
     """
+    args = parse_args()
     create_tables()
-    cli = CLI()
-    cli.run()
+    cli = CLI(row_limit=args.limit, workers=args.workers)
+    if args.command == "run-pledges":
+        cli.materialize_pledges(args.until)
+    elif args.command == "changes-since":
+        cli.export_changes(args.after, args.max_changes)
+    else:
+        cli.run()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file